@@ -24,11 +24,11 @@ OID_END_OCTET_STRING = -4  # yet same, but omit first byte (assuming that is the
 
 
 class OIDCached(OIDSpec):
-    pass
+    __slots__ = ()
 
 
 class OIDBytes(OIDSpec):
-    pass
+    __slots__ = ()
 
 
 def binstring_to_int(binstring):
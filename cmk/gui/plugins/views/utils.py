@@ -1025,6 +1025,15 @@ class Sorter(six.with_metaclass(abc.ABCMeta, object)):
         one service, etc."""
         raise NotImplementedError()
 
+    @property
+    def sort_key(self):
+        # type: () -> Optional[Callable[[Row], Any]]
+        """Optional key function which orders the rows exactly like cmp does
+
+        When all sorters of a view provide a key function, the rows are sorted
+        by their keys instead of comparing them pairwise with cmp."""
+        return None
+
     @property
     def _args(self):
         # type: () -> Optional[List]
@@ -1064,6 +1073,7 @@ def register_sorter(ident, spec):
             "title": property(lambda s: s._spec["title"]),
             "columns": property(lambda s: s._spec["columns"]),
             "load_inv": property(lambda s: s._spec.get("load_inv", False)),
+            "sort_key": property(lambda s: s._spec.get("sort_key")),
             "cmp": spec["cmp"],
         })
     sorter_registry.register(cls)
@@ -1266,7 +1276,8 @@ def declare_simple_sorter(name, title, column, func):
     register_sorter(name, {
         "title": title,
         "columns": [column],
-        "cmp": lambda self, r1, r2: func(column, r1, r2)
+        "cmp": lambda self, r1, r2: func(column, r1, r2),
+        "sort_key": _sort_key_of(func, column),
     })
 
 
@@ -1283,10 +1294,21 @@ def declare_1to1_sorter(painter_name, func, col_num=0, reverse=False):
         "title": painter.title,
         "columns": painter.columns,
         "cmp": cmp_func,
+        "sort_key": None if reverse else _sort_key_of(func, painter.columns[col_num]),
     })
     return painter_name
 
 
+def _sort_key_of(func, column):
+    # type: (SorterFunction, ColumnName) -> Optional[Callable[[Row], Any]]
+    """Returns the key function equivalent to the given compare function, if there is one"""
+    if func is cmp_simple_number:
+        return lambda row: row[column]
+    if func is cmp_simple_string:
+        return lambda row: insensitive_string_key(row.get(column, ''))
+    return None
+
+
 def cmp_simple_number(column, r1, r2):
     # type: (ColumnName, Row, Row) -> int
     v1 = r1[column]
@@ -1305,6 +1327,12 @@ def cmp_simple_string(column, r1, r2):
     return cmp_insensitive_string(v1, v2)
 
 
+def insensitive_string_key(value):
+    # type: (str) -> Tuple[str, str]
+    """Key function ordering strings like cmp_insensitive_string"""
+    return value.lower(), value
+
+
 def cmp_insensitive_string(v1, v2):
     # type: (str, str) -> int
     c = (v1.lower() > v2.lower()) - (v1.lower() < v2.lower())
@@ -1729,6 +1757,8 @@ class Cell(object):
         self._link_view_name = None  # type: Optional[ViewName]
         self._tooltip_painter_name = None  # type: Optional[PainterName]
         self._custom_title = None  # type: Optional[Text]
+        self._painter = None  # type: Optional[Painter]
+        self._needed_columns = None  # type: Optional[Set[ColumnName]]
 
         if painter_spec:
             self._from_view(painter_spec)
@@ -1748,8 +1778,15 @@ class Cell(object):
 
     def needed_columns(self):
         # type: () -> Set[ColumnName]
-        """Get a list of columns we need to fetch in order to render this cell"""
+        """Get a list of columns we need to fetch in order to render this cell
 
+        The result is computed once per cell. Don't modify it."""
+        if self._needed_columns is None:
+            self._needed_columns = self._compute_needed_columns()
+        return self._needed_columns
+
+    def _compute_needed_columns(self):
+        # type: () -> Set[ColumnName]
         columns = set(self.painter().columns)
 
         if self._link_view_name:
@@ -1792,7 +1829,9 @@ class Cell(object):
 
     def painter(self):
         # type: () -> Painter
-        return painter_registry[self.painter_name()]()
+        if self._painter is None:
+            self._painter = painter_registry[self.painter_name()]()
+        return self._painter
 
     def painter_name(self):
         # type: () -> PainterName
@@ -77,6 +77,7 @@ from cmk.gui.plugins.views.utils import (
     get_tag_groups,
     _parse_url_sorters,
     SorterEntry,
+    SorterSpec,
 )
 
 # Needed for legacy (pre 1.6) plugins
@@ -108,9 +109,9 @@ if cmk_version.is_managed_edition():
 
 from cmk.gui.type_defs import PainterSpec
 if TYPE_CHECKING:
-    from cmk.gui.plugins.views.utils import Sorter, SorterSpec  # pylint: disable=unused-import
+    from cmk.gui.plugins.views.utils import Sorter  # pylint: disable=unused-import
     from cmk.gui.plugins.visuals.utils import Filter  # pylint: disable=unused-import
-    from cmk.gui.type_defs import FilterHeaders, Row, Rows, ColumnName  # pylint: disable=unused-import
+    from cmk.gui.type_defs import FilterHeaders, Row, Rows, ColumnName, HTTPVariables  # pylint: disable=unused-import
 
 # Datastructures and functions needed before plugins can be loaded
 loaded_with_language = False  # type: Union[bool, None, str]
@@ -211,6 +212,12 @@ def _has_inventory_tree(linking_view, rows, view, context_vars, invpath, is_hist
     except MKUserError:
         return False
 
+    # The history tree is only built from the inventory file. Don't try to load and filter
+    # it in case the host has no inventory at all. The current tree can not be skipped this
+    # way, because it is merged with the status data which is fetched via livestatus.
+    if is_history and not inventory.has_inventory(hostname):
+        return False
+
     # FIXME In order to decide whether this view is enabled
     # do we really need to load the whole tree?
     try:
@@ -284,14 +291,26 @@ class View(object):
         self._row_limit = None  # type: Optional[int]
         self._only_sites = None  # type: Optional[List[SiteId]]
         self._user_sorters = None  # type: Optional[List[SorterSpec]]
+        # The configured and the user sorters, normalized to SorterSpec
+        self._spec_sorter_specs = _to_sorter_specs(view_spec.get("sorters", []))
+        self._user_sorter_specs = []  # type: List[SorterSpec]
+        self._row_cells = None  # type: Optional[List[Cell]]
+        self._group_cells = None  # type: Optional[List[Cell]]
+        self._join_cells = None  # type: Optional[List[JoinCell]]
+        self._sorters = None  # type: Optional[List[SorterEntry]]
+        self._datasource = None  # type: Optional[DataSource]
 
     @property
     def datasource(self):
         # type: () -> DataSource
+        if self._datasource is not None:
+            return self._datasource
+
+        ds_name = self.spec["datasource"]
         try:
-            return data_source_registry[self.spec["datasource"]]()
+            self._datasource = data_source_registry[ds_name]()
         except KeyError:
-            if self.spec["datasource"].startswith("mkeventd_"):
+            if ds_name.startswith("mkeventd_"):
                 raise MKUserError(
                     None,
                     _("The Event Console view '%s' can not be rendered. The Event Console is possibly "
@@ -299,55 +318,70 @@ class View(object):
             raise MKUserError(
                 None,
                 _("The view '%s' using the datasource '%s' can not be rendered "
-                  "because the datasource does not exist.") % (self.name, self.datasource))
+                  "because the datasource does not exist.") % (self.name, ds_name))
+        return self._datasource
 
     @property
     def row_cells(self):
         # type: () -> List[Cell]
         """Regular cells are displaying information about the rows of the type the view is about"""
-        cells = []  # type: List[Cell]
-        for e in self.spec["painters"]:
-            if not painter_exists(e):
-                continue
-
-            if e.join_index is not None:
-                cells.append(JoinCell(self, e))
-            else:
-                cells.append(Cell(self, e))
-
-        return cells
+        if self._row_cells is None:
+            self._build_cells()
+            assert self._row_cells is not None
+        return self._row_cells
 
     @property
     def group_cells(self):
         # type: () -> List[Cell]
         """Group cells are displayed as titles of grouped rows"""
-        return [Cell(self, e) for e in self.spec["group_painters"] if painter_exists(e)]
+        if self._group_cells is None:
+            self._group_cells = [
+                Cell(self, e) for e in self.spec["group_painters"] if painter_exists(e)
+            ]
+        return self._group_cells
 
     @property
     def join_cells(self):
         # type: () -> List[JoinCell]
         """Join cells are displaying information of a joined source (e.g.service data on host views)"""
-        return [x for x in self.row_cells if isinstance(x, JoinCell)]
+        if self._join_cells is None:
+            self._build_cells()
+            assert self._join_cells is not None
+        return self._join_cells
+
+    def _build_cells(self):
+        # type: () -> None
+        """Create the row cells and the join cells of the view in a single pass"""
+        cells = []  # type: List[Cell]
+        join_cells = []  # type: List[JoinCell]
+        for e in self.spec["painters"]:
+            if not painter_exists(e):
+                continue
+
+            if e.join_index is not None:
+                join_cell = JoinCell(self, e)
+                cells.append(join_cell)
+                join_cells.append(join_cell)
+            else:
+                cells.append(Cell(self, e))
+
+        self._row_cells = cells
+        self._join_cells = join_cells
 
     @property
     def sorters(self):
         # type: () -> List[SorterEntry]
         """Returns the list of effective sorters to be used to sort the rows of this view"""
-        return self._get_sorter_entries(
-            self.user_sorters if self.user_sorters else self.spec["sorters"])
+        if self._sorters is None:
+            self._sorters = self._get_sorter_entries(
+                self._user_sorter_specs if self._user_sorter_specs else self._spec_sorter_specs)
+        return self._sorters
 
-    # TODO: Improve argument type
     def _get_sorter_entries(self, sorter_list):
-        # type: (List) -> List[SorterEntry]
+        # type: (List[SorterSpec]) -> List[SorterEntry]
         sorters = []
         for entry in sorter_list:
-            if not isinstance(entry, SorterEntry):
-                entry = SorterEntry(*entry)
-
-            sorter_name = entry.sorter
-            uuid = None
-            if ":" in entry.sorter:
-                sorter_name, uuid = entry.sorter.split(':', 1)
+            sorter_name, _sep, uuid = entry.sorter.partition(':')
 
             sorter = sorter_registry.get(sorter_name, None)
 
@@ -356,7 +390,7 @@ class View(object):
 
             sorter = sorter()
             if hasattr(sorter, 'derived_columns'):
-                sorter.derived_columns(self, uuid)
+                sorter.derived_columns(self, uuid or None)
 
             sorters.append(SorterEntry(sorter=sorter, negate=entry.negate, join_key=entry.join_key))
         return sorters
@@ -403,6 +437,14 @@ class View(object):
     def user_sorters(self, user_sorters):
         # type: (Optional[List[SorterSpec]]) -> None
         self._user_sorters = user_sorters
+        self._user_sorter_specs = _to_sorter_specs(user_sorters) if user_sorters else []
+        self._sorters = None
+
+
+def _to_sorter_specs(sorter_list):
+    # type: (List) -> List[SorterSpec]
+    """Sorters may be configured as plain tuples. Bring them into the SorterSpec format"""
+    return [s if isinstance(s, SorterSpec) else SorterSpec(*s) for s in sorter_list]
 
 
 class ViewRenderer(six.with_metaclass(abc.ABCMeta, object)):
@@ -426,16 +468,30 @@ class GUIViewRenderer(ViewRenderer):
     def render(self, rows, group_cells, cells, show_checkboxes, layout, num_columns, show_filters,
                unfiltered_amount_of_rows):
         view_spec = self.view.spec
+        datasource = self.view.datasource
+
+        # These don't change during rendering and are needed several times below
+        transaction_valid = html.transaction_valid()
+        actions_requested = html.do_actions()
+        show_html_header = display_options.enabled(display_options.H)
+        show_command_display = display_options.enabled(display_options.C)
+        show_refresh_container = display_options.enabled(display_options.R)
+        show_warnings = display_options.enabled(display_options.W)
 
-        if html.transaction_valid() and html.do_actions():
+        if transaction_valid and actions_requested:
             html.set_browser_reload(0)
 
+        show_top_heading = display_options.enabled(display_options.T)
+        if show_html_header or show_top_heading:
+            # Computing the title may be expensive (context titles, title plugins)
+            title = view_title(view_spec)
+
         # Show/Hide the header with page title, MK logo, etc.
-        if display_options.enabled(display_options.H):
-            html.body_start(view_title(view_spec))
+        if show_html_header:
+            html.body_start(title)
 
-        if display_options.enabled(display_options.T):
-            html.top_heading(view_title(view_spec))
+        if show_top_heading:
+            html.top_heading(title)
 
         has_done_actions = False
         row_count = len(rows)
@@ -443,11 +499,20 @@ class GUIViewRenderer(ViewRenderer):
         # This is a general flag which makes the command form render when the current
         # view might be able to handle commands. When no commands are possible due missing
         # permissions or datasources without commands, the form is not rendered
-        command_form = should_show_command_form(self.view.datasource)
+        command_form = should_show_command_form(datasource)
 
         if command_form:
             weblib.init_selection()
 
+        # The row selection of the user is needed for filtering the rows during actions and
+        # for the number of selected rows in the header info. Read it only once and use a set
+        # for the membership tests of filter_selected_rows().
+        selected_ids = None  # type: Optional[Set[str]]
+        rows_are_selected = False
+        if show_checkboxes:
+            selected_ids = set(
+                config.user.get_rowselection(weblib.selection_id(), 'view-' + view_spec['name']))
+
         if self._show_buttons:
             _show_context_links(
                 self.view,
@@ -471,45 +536,41 @@ class GUIViewRenderer(ViewRenderer):
         if command_form:
             # There are one shot actions which only want to affect one row, filter the rows
             # by this id during actions
-            if html.request.has_var("_row_id") and html.do_actions():
+            if html.request.has_var("_row_id") and actions_requested:
                 rows = filter_by_row_id(view_spec, rows)
 
             # If we are currently within an action (confirming or executing), then
             # we display only the selected rows (if checkbox mode is active)
-            elif show_checkboxes and html.do_actions():
-                rows = filter_selected_rows(
-                    view_spec, rows,
-                    config.user.get_rowselection(weblib.selection_id(),
-                                                 'view-' + view_spec['name']))
+            elif show_checkboxes and actions_requested:
+                rows = filter_selected_rows(view_spec, rows, selected_ids)
+                rows_are_selected = True
 
-            if html.do_actions() and html.transaction_valid():  # submit button pressed, no reload
+            if actions_requested and transaction_valid:  # submit button pressed, no reload
                 try:
                     # Create URI with all actions variables removed
                     backurl = html.makeuri([], delvars=['filled_in', 'actions'])
-                    has_done_actions = do_actions(view_spec, self.view.datasource.infos[0], rows,
-                                                  backurl)
+                    has_done_actions = do_actions(view_spec, datasource.infos[0], rows, backurl)
                 except MKUserError as e:
                     html.show_error("%s" % e)
                     html.add_user_error(e.varname, e)
-                    if display_options.enabled(display_options.C):
-                        show_command_form(True, self.view.datasource)
+                    if show_command_display:
+                        show_command_form(True, datasource)
 
-            elif display_options.enabled(
-                    display_options.C):  # (*not* display open, if checkboxes are currently shown)
-                show_command_form(False, self.view.datasource)
+            elif show_command_display:  # (*not* display open, if checkboxes are currently shown)
+                show_command_form(False, datasource)
 
         # Also execute commands in cases without command form (needed for Python-
         # web service e.g. for NagStaMon)
         elif row_count > 0 and config.user.may("general.act") \
-             and html.do_actions() and html.transaction_valid():
+             and actions_requested and transaction_valid:
 
             # There are one shot actions which only want to affect one row, filter the rows
             # by this id during actions
-            if html.request.has_var("_row_id") and html.do_actions():
+            if html.request.has_var("_row_id"):
                 rows = filter_by_row_id(view_spec, rows)
 
             try:
-                do_actions(view_spec, self.view.datasource.infos[0], rows, '')
+                do_actions(view_spec, datasource.infos[0], rows, '')
             except Exception:
                 pass  # currently no feed back on webservice
 
@@ -517,24 +578,25 @@ class GUIViewRenderer(ViewRenderer):
         painter_options.show_form(self.view)
 
         # The refreshing content container
-        if display_options.enabled(display_options.R):
+        if show_refresh_container:
             html.open_div(id_="data_container")
 
         if not has_done_actions:
-            if display_options.enabled(display_options.W):
-                if cmk.gui.view_utils.row_limit_exceeded(unfiltered_amount_of_rows,
-                                                         self.view.row_limit):
-                    cmk.gui.view_utils.query_limit_exceeded_warn(self.view.row_limit, config.user)
-                    del rows[self.view.row_limit:]
+            if show_warnings:
+                row_limit = self.view.row_limit
+                if cmk.gui.view_utils.row_limit_exceeded(unfiltered_amount_of_rows, row_limit):
+                    cmk.gui.view_utils.query_limit_exceeded_warn(row_limit, config.user)
+                    if row_limit is not None and len(rows) > row_limit:
+                        del rows[row_limit:]
             layout.render(rows, view_spec, group_cells, cells, num_columns, show_checkboxes and
-                          not html.do_actions())
+                          not actions_requested)
             headinfo = "%d %s" % (row_count, _("row") if row_count == 1 else _("rows"))
             if show_checkboxes:
-                selected = filter_selected_rows(
-                    view_spec, rows,
-                    config.user.get_rowselection(weblib.selection_id(),
-                                                 'view-' + view_spec['name']))
-                headinfo = "%d/%s" % (len(selected), headinfo)
+                if rows_are_selected:
+                    num_selected = len(rows)
+                else:
+                    num_selected = len(filter_selected_rows(view_spec, rows, selected_ids))
+                headinfo = "%d/%s" % (num_selected, headinfo)
 
             if html.output_format == "html":
                 html.javascript("cmk.utils.update_header_info(%s);" % json.dumps(headinfo))
@@ -544,7 +606,7 @@ class GUIViewRenderer(ViewRenderer):
                     update_context_links(
                         # don't take display_options into account here ('c' is set during reload)
                         row_count > 0 and
-                        should_show_command_form(self.view.datasource, ignore_display_option=True),
+                        should_show_command_form(datasource, ignore_display_option=True),
                         # and not html.do_actions(),
                         layout.can_display_checkboxes)
 
@@ -558,8 +620,7 @@ class GUIViewRenderer(ViewRenderer):
         # In multi site setups error messages of single sites do not block the
         # output and raise now exception. We simply print error messages here.
         # In case of the web service we show errors only on single site installations.
-        if (config.show_livestatus_errors and display_options.enabled(display_options.W) and
-                html.output_format == "html"):
+        if config.show_livestatus_errors and show_warnings and html.output_format == "html":
             for info in sites.live().dead_sites().values():
                 if isinstance(info["site"], dict):
                     html.show_error(
@@ -567,7 +628,7 @@ class GUIViewRenderer(ViewRenderer):
                         (info["site"]["alias"], _('Livestatus error'), info["exception"]))
 
         # FIXME: Sauberer waere noch die Status Icons hier mit aufzunehmen
-        if display_options.enabled(display_options.R):
+        if show_refresh_container:
             html.close_div()
 
         pid = os.getpid()
@@ -580,7 +641,7 @@ class GUIViewRenderer(ViewRenderer):
         if display_options.enabled(display_options.Z):
             html.bottom_footer()
 
-        if display_options.enabled(display_options.H):
+        if show_html_header:
             html.body_end()
 
 
@@ -619,12 +680,14 @@ def load_plugins(force):
     cmk.gui.plugins.views.inventory.declare_inventory_columns()
 
     # TODO: Kept for compatibility with pre 1.6 plugins
-    for ident, spec in multisite_painters.items():
-        register_painter(ident, spec)
+    if multisite_painters:
+        for ident, spec in multisite_painters.items():
+            register_painter(ident, spec)
 
     # TODO: Kept for compatibility with pre 1.6 plugins
-    for ident, spec in multisite_sorters.items():
-        register_sorter(ident, spec)
+    if multisite_sorters:
+        for ident, spec in multisite_sorters.items():
+            register_sorter(ident, spec)
 
     # This must be set after plugin loading to make broken plugins raise
     # exceptions all the time and not only the first time (when the plugins
@@ -645,6 +708,9 @@ def load_plugins(force):
 
 # Transform pre 1.6 icon plugins. Deprecate this one day.
 def transform_old_dict_based_icons():
+    if not multisite_icons_and_actions:
+        return
+
     for icon_id, icon in multisite_icons_and_actions.items():
         icon_class = type(
             "LegacyIcon%s" % icon_id.title(), (Icon,), {
@@ -662,27 +728,48 @@ def transform_old_dict_based_icons():
         icon_and_action_registry.register(icon_class)
 
 
+# Hash of the tag config the host tag painters and sorters have been registered for
+_tag_plugins_config_hash = None  # type: Optional[int]
+
+
 def _register_tag_plugins():
-    if getattr(_register_tag_plugins, "_config_hash", None) == _calc_config_hash():
+    global _tag_plugins_config_hash
+    config_hash = _calc_config_hash()
+    if _tag_plugins_config_hash == config_hash:
         return  # No re-register needed :-)
     _register_host_tag_painters()
     _register_host_tag_sorters()
-    setattr(_register_tag_plugins, "_config_hash", _calc_config_hash())
+    _tag_plugins_config_hash = config_hash
 
 
 def _calc_config_hash():
     # type: () -> int
-    return hash(repr(config.tags.get_dict_format()))
+    return hash(_canonical_tags(config.tags.get_dict_format()))
+
+
+def _canonical_tags(value):
+    # type: (Any) -> Any
+    """Convert the dict format of the tag config to nested tuples which can be hashed directly"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonical_tags(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_canonical_tags(v) for v in value)
+    return value
 
 
 config.register_post_config_load_hook(_register_tag_plugins)
 
 
+# The idents of the painters registered by _register_host_tag_painters()
+_registered_host_tag_painters = set()  # type: Set[str]
+
+
 def _register_host_tag_painters():
     # first remove all old painters to reflect delted painters during runtime
-    for key in list(painter_registry.keys()):
-        if key.startswith('host_tag_'):
-            painter_registry.unregister(key)
+    for ident in _registered_host_tag_painters:
+        if ident in painter_registry:
+            painter_registry.unregister(ident)
+    _registered_host_tag_painters.clear()
 
     for tag_group in config.tags.tag_groups:
         if tag_group.topic:
@@ -691,28 +778,47 @@ def _register_host_tag_painters():
             long_title = tag_group.title
 
         ident = "host_tag_" + tag_group.id
-        spec = {
-            "title": _("Host tag:") + ' ' + long_title,
-            "short": tag_group.title,
-            "columns": ["host_tags"],
-        }
         cls = type(
-            "HostTagPainter%s" % str(tag_group.id).title(),
-            (Painter,),
-            {
+            "HostTagPainter%s" % str(tag_group.id).title(), (HostTagPainter,), {
                 "_ident": ident,
-                "_spec": spec,
                 "_tag_group_id": tag_group.id,
-                "ident": property(lambda self: self._ident),
-                "title": lambda self, cell: self._spec["title"],
-                "short_title": lambda self, cell: self._spec["short"],
-                "columns": property(lambda self: self._spec["columns"]),
-                "render": lambda self, row, cell: _paint_host_tag(row, self._tag_group_id),
-                # Use title of the tag value for grouping, not the complete
-                # dictionary of custom variables!
-                "group_by": lambda self, row: _paint_host_tag(row, self._tag_group_id)[1],
+                "_title": _("Host tag:") + ' ' + long_title,
+                "_short": tag_group.title,
             })
         painter_registry.register(cls)
+        _registered_host_tag_painters.add(ident)
+
+
+class HostTagPainter(Painter):
+    """Paints the value of one host tag group
+
+    The concrete classes are created per tag group by _register_host_tag_painters()"""
+    _ident = ""
+    _tag_group_id = ""  # type: Text
+    _title = u""  # type: Text
+    _short = u""  # type: Text
+
+    @property
+    def ident(self):
+        return self._ident
+
+    def title(self, cell):
+        return self._title
+
+    def short_title(self, cell):
+        return self._short
+
+    @property
+    def columns(self):
+        return ["host_tags"]
+
+    def render(self, row, cell):
+        return _paint_host_tag(row, self._tag_group_id)
+
+    def group_by(self, row):
+        # Use title of the tag value for grouping, not the complete
+        # dictionary of custom variables!
+        return _paint_host_tag(row, self._tag_group_id)[1]
 
 
 def _paint_host_tag(row, tgid):
@@ -739,15 +845,30 @@ def _cmp_host_tag(r1, r2, tgid):
 def _get_tag_group_value(row, what, tag_group_id):
     tag_id = get_tag_groups(row, "host").get(tag_group_id)
 
-    tag_group = config.tags.get_tag_group(tag_group_id)
-    if tag_group:
-        label = dict(tag_group.get_tag_choices()).get(tag_id, _("N/A"))
+    tag_choices = _get_tag_choices(tag_group_id)
+    if tag_choices is not None:
+        label = tag_choices.get(tag_id, _("N/A"))
     else:
         label = tag_id
 
     return label or _("N/A")
 
 
+def _get_tag_choices(tag_group_id):
+    # type: (str) -> Optional[Dict[Optional[str], Text]]
+    """Returns the tag titles of a tag group by tag ID, cached for the current request
+
+    Painting and sorting by a host tag needs these for every row."""
+    tag_choices_cache = g.setdefault("tag_choices_cache", {})
+    if tag_group_id in tag_choices_cache:
+        return tag_choices_cache[tag_group_id]
+
+    tag_group = config.tags.get_tag_group(tag_group_id)
+    tag_choices = dict(tag_group.get_tag_choices()) if tag_group else None
+    tag_choices_cache[tag_group_id] = tag_choices
+    return tag_choices
+
+
 #.
 #   .--Table of views------------------------------------------------------.
 #   |   _____     _     _               __         _                       |
@@ -986,9 +1107,10 @@ def view_editor_column_spec(ident, title, ds_name):
 
     def column_elements(_painters, painter_type):
         empty_choices = [(None, "")]  # type: List[DropdownChoiceEntry]
+        choices_with_params = painter_choices_with_params(_painters)
         elements = [
             CascadingDropdown(title=_('Column'),
-                              choices=painter_choices_with_params(_painters),
+                              choices=choices_with_params,
                               no_preselect=True,
                               render_sub_vs_page_name="ajax_cascading_render_painer_parameters",
                               render_sub_vs_request_vars={
@@ -1002,7 +1124,7 @@ def view_editor_column_spec(ident, title, ds_name):
             ),
             DropdownChoice(
                 title=_('Tooltip'),
-                choices=empty_choices + painter_choices(_painters),
+                choices=empty_choices + [(c[0], c[1]) for c in choices_with_params],
             )
         ]
         if painter_type == 'join_painter':
@@ -1556,20 +1678,14 @@ def _get_needed_regular_columns(cells, sorters, datasource):
 
     # Columns needed for sorters
     # TODO: Move sorter parsing and logic to something like Cells()
-    for entry in sorters:
-        columns.update(entry.sorter.columns)
-
-    # Add key columns, needed for executing commands
-    columns.update(datasource.keys)
+    columns.update(*[entry.sorter.columns for entry in sorters])
 
-    # Add idkey columns, needed for identifying the row
-    columns.update(datasource.id_keys)
+    # Add key columns, needed for executing commands and idkey columns, needed for
+    # identifying the row
+    columns.update(datasource.keys, datasource.id_keys)
 
     # Remove (implicit) site column
-    try:
-        columns.remove("site")
-    except KeyError:
-        pass
+    columns.discard("site")
 
     # In the moment the context buttons are shown, the link_from mechanism is used
     # to decide to which other views/dashboards the context buttons should link to.
@@ -1590,17 +1706,18 @@ def _get_needed_regular_columns(cells, sorters, datasource):
 def get_livestatus_filter_headers(view, all_active_filters):
     # type: (View, List[Filter]) -> FilterHeaders
     """Prepare Filter headers for Livestatus"""
-    filterheaders = ""
+    ds_name = view.datasource.ident
+    filterheaders = []  # type: List[FilterHeaders]
     for filt in all_active_filters:
         try:
             filt.validate_value(filt.value())
             # TODO: Argument does not seem to be used anywhere. Remove it
-            header = filt.filter(view.datasource.ident)
+            header = filt.filter(ds_name)
         except MKUserError as e:
             html.add_user_error(e.varname, e)
             continue
-        filterheaders += header
-    return filterheaders
+        filterheaders.append(header)
+    return "".join(filterheaders)
 
 
 def _get_needed_join_columns(join_cells, sorters):
@@ -1609,14 +1726,10 @@ def _get_needed_join_columns(join_cells, sorters):
 
     # Columns needed for sorters
     # TODO: Move sorter parsing and logic to something like Cells()
-    for entry in sorters:
-        join_columns.update(entry.sorter.columns)
+    join_columns.update(*[entry.sorter.columns for entry in sorters])
 
     # Remove (implicit) site column
-    try:
-        join_columns.remove("site")
-    except KeyError:
-        pass
+    join_columns.discard("site")
 
     return list(join_columns)
 
@@ -1629,18 +1742,19 @@ def is_sla_data_needed(group_cells, cells, sorters, all_active_filters):
 def is_inventory_data_needed(group_cells, cells, sorters, all_active_filters):
     # type: (List[Cell], List[Cell], List[SorterEntry], List[Filter]) -> bool
     for cell in cells:
-        if cell.has_tooltip():
-            if cell.tooltip_painter_name().startswith("inv_"):
-                return True
-
-    for entry in sorters:
-        if entry.sorter.load_inv:
+        if cell.painter().load_inv:
+            return True
+        if cell.has_tooltip() and cell.tooltip_painter_name().startswith("inv_"):
             return True
 
-    for cell in group_cells + cells:
+    for cell in group_cells:
         if cell.painter().load_inv:
             return True
 
+    for entry in sorters:
+        if entry.sorter.load_inv:
+            return True
+
     for filt in all_active_filters:
         if filt.need_inventory():
             return True
@@ -1650,10 +1764,7 @@ def is_inventory_data_needed(group_cells, cells, sorters, all_active_filters):
 
 def columns_of_cells(cells):
     # type: (Sequence[Cell]) -> Set[ColumnName]
-    columns = set()  # type: Set[ColumnName]
-    for cell in cells:
-        columns.update(cell.needed_columns())
-    return columns
+    return set().union(*[cell.needed_columns() for cell in cells])
 
 
 def _do_table_join(view, master_rows, master_filters, sorters):
@@ -1683,23 +1794,18 @@ def _do_table_join(view, master_rows, master_filters, sorters):
     JoinMasterKey = _Tuple[SiteId, Union[str, Text]]  # pylint: disable=unused-variable
     JoinSlaveKey = Union[str, Text]  # pylint: disable=unused-variable
 
+    # Add the join information into master table in artificial column "JOIN". The index is
+    # built from the master rows, which need a JOIN dict anyway. Slave rows are then sorted
+    # into the dict of their master, independent of the order livestatus returns them in.
+    # Slave rows without a master row are dropped right away.
     per_master_entry = {}  # type: Dict[JoinMasterKey, Dict[JoinSlaveKey, LivestatusRow]]
-    current_key = None  # type: Optional[JoinMasterKey]
-    current_entry = None  # type: Optional[Dict[JoinSlaveKey, LivestatusRow]]
-    for row in rows:
-        master_key = (row["site"], row[join_master_column])
-        if master_key != current_key:
-            current_key = master_key
-            current_entry = {}
-            per_master_entry[current_key] = current_entry
-        assert current_entry is not None
-        current_entry[row[join_slave_column]] = row
-
-    # Add this information into master table in artificial column "JOIN"
     for row in master_rows:
-        key = (row["site"], row[join_master_column])
-        joininfo = per_master_entry.get(key, {})
-        row["JOIN"] = joininfo
+        row["JOIN"] = per_master_entry.setdefault((row["site"], row[join_master_column]), {})
+
+    for row in rows:
+        joininfo = per_master_entry.get((row["site"], row[join_master_column]))
+        if joininfo is not None:
+            joininfo[row[join_slave_column]] = row
 
 
 g_alarm_sound_states = set([])  # type: Set[str]
@@ -1710,17 +1816,25 @@ def clear_alarm_sound_states():
     g_alarm_sound_states.clear()
 
 
+# TODO: Move this to a generic place. What about -1?
+_alarm_sound_host_state_map = {0: "up", 1: "down", 2: "unreachable"}
+_alarm_sound_service_state_map = {0: "up", 1: "warning", 2: "critical", 3: "unknown"}
+_all_alarm_sound_states = frozenset(
+    list(_alarm_sound_host_state_map.values()) + list(_alarm_sound_service_state_map.values()))
+
+
 def save_state_for_playing_alarm_sounds(row):
     # type: (Row) -> None
     if not config.enable_sounds or not config.sounds:
         return
 
-    # TODO: Move this to a generic place. What about -1?
-    host_state_map = {0: "up", 1: "down", 2: "unreachable"}
-    service_state_map = {0: "up", 1: "warning", 2: "critical", 3: "unknown"}
+    # Nothing to add once all states have been seen
+    if g_alarm_sound_states.issuperset(_all_alarm_sound_states):
+        return
 
-    for state_map, state in [(host_state_map, row.get("host_hard_state", row.get("host_state"))),
-                             (service_state_map,
+    for state_map, state in [(_alarm_sound_host_state_map,
+                              row.get("host_hard_state", row.get("host_state"))),
+                             (_alarm_sound_service_state_map,
                               row.get("service_last_hard_state", row.get("service_state")))]:
         if state is None:
             continue
@@ -1787,7 +1901,8 @@ def view_optiondial(view, option, choices, help_txt):
     painter_options = PainterOptions.get_instance()
     value = painter_options.get(option, dflt=view.get(name, choices[0][0]))
 
-    title = dict(choices).get(value, value)
+    title = next((choice_title for choice_value, choice_title in choices if choice_value == value),
+                 value)
     html.begin_context_buttons()  # just to be sure
     html.open_div(id_="optiondial_%s" % option,
                   class_=["optiondial", option, "val_%s" % value],
@@ -2012,27 +2127,31 @@ def _link_to_host_by_name(host_name):
 
 
 def update_context_links(enable_command_toggle, enable_checkbox_toggle):
-    html.javascript("cmk.views.update_togglebutton('commands', %d);" %
-                    (enable_command_toggle and 1 or 0))
-    html.javascript("cmk.views.update_togglebutton('checkbox', %d);" %
-                    (enable_command_toggle and enable_checkbox_toggle and 1 or 0,))
+    html.javascript("cmk.views.update_togglebutton('commands', %d);"
+                    "cmk.views.update_togglebutton('checkbox', %d);" %
+                    (enable_command_toggle and 1 or 0, enable_command_toggle and
+                     enable_checkbox_toggle and 1 or 0))
 
 
 def collect_context_links(view, rows, mobile=False, only_types=None):
     """Collect all visuals that share a context with visual. For example
     if a visual has a host context, get all relevant visuals."""
-    if only_types is None:
-        only_types = []
+    if only_types:
+        visual_type_names = [what for what in only_types if what in visual_type_registry]
+    else:
+        visual_type_names = list(visual_type_registry.keys())
+
+    if not visual_type_names:
+        return []
 
     # compute collections of set single context related request variables needed for this visual
     singlecontext_request_vars = visuals.get_singlecontext_html_vars(view.spec["context"],
                                                                      view.spec["single_infos"])
 
     context_links = []
-    for what in visual_type_registry.keys():
-        if not only_types or what in only_types:
-            context_links += _collect_context_links_of(what, view, rows, singlecontext_request_vars,
-                                                       mobile)
+    for what in visual_type_names:
+        context_links += _collect_context_links_of(what, view, rows, singlecontext_request_vars,
+                                                   mobile)
     return context_links
 
 
@@ -2042,36 +2161,26 @@ def _collect_context_links_of(visual_type_name, view, rows, singlecontext_reques
     visual_type = visual_type_registry[visual_type_name]()
     visual_type.load_handler()
     available_visuals = visual_type.permitted_visuals
-
-    for visual in sorted(available_visuals.values(), key=lambda x: x.get('icon') or ""):
+    context_vars = set(singlecontext_request_vars)
+
+    # The links to visuals with multiple contexts carry all current request variables, like
+    # html.makeuri() would add them. Collect them once for all links of this type.
+    if visual_type.multicontext_links:
+        request_vars = [(varname, value)
+                        for varname, value in html.request.itervars()
+                        if varname[0] != "_" and varname != visual_type.ident_attr
+                       ]  # type: HTTPVariables
+
+    for visual in sorted(_link_target_candidates(available_visuals, visual_type, view, mobile),
+                         key=lambda x: x.get('icon') or ""):
         name = visual["name"]
-        linktitle = visual.get("linktitle")
-        if not linktitle:
-            linktitle = visual["title"]
-        if visual == view.spec:
-            continue
-        if visual.get("hidebutton", False):
-            continue  # this visual does not want a button to be displayed
-
-        if not mobile and visual.get('mobile') \
-           or mobile and not visual.get('mobile'):
-            continue
-
-        # For dashboards and views we currently only show a link button,
-        # if the target dashboard/view shares a single info with the
-        # current visual.
-        if not visual['single_infos'] and not visual_type.multicontext_links:
-            continue  # skip non single visuals for dashboard, views
 
         # We can show a button only if all single contexts of the
         # target visual are known currently
-        skip = False
-        vars_values = []
-        for var in visuals.get_single_info_keys(visual["single_infos"]):
-            if var not in singlecontext_request_vars:
-                skip = True  # At least one single context missing
-                break
-            vars_values.append((var, singlecontext_request_vars[var]))
+        single_info_keys = visuals.get_single_info_keys(visual["single_infos"])
+        if not context_vars.issuperset(single_info_keys):
+            continue  # At least one single context missing
+        vars_values = [(var, singlecontext_request_vars[var]) for var in single_info_keys]
 
         add_site_hint = visuals.may_add_site_hint(name,
                                                   info_keys=list(visual_info_registry.keys()),
@@ -2085,10 +2194,7 @@ def _collect_context_links_of(visual_type_name, view, rows, singlecontext_reques
         # This has been implemented for HW/SW inventory views which are often useless when a host
         # has no such information available. For example the "Oracle Tablespaces" inventory view
         # is useless on hosts that don't host Oracle databases.
-        if not skip:
-            skip = not visual_type.link_from(view, rows, visual, vars_values)
-
-        if not skip:
+        if visual_type.link_from(view, rows, visual, vars_values):
             filename = visual_type.show_url
             if mobile and visual_type.show_url == 'view.py':
                 filename = 'mobile_' + visual_type.show_url
@@ -2096,13 +2202,17 @@ def _collect_context_links_of(visual_type_name, view, rows, singlecontext_reques
             # add context link to this visual. For reports we put in
             # the *complete* context, even the non-single one.
             if visual_type.multicontext_links:
-                uri = html.makeuri([(visual_type.ident_attr, name)], filename=filename)
+                uri = html.makeuri_contextless(request_vars + [(visual_type.ident_attr, name)],
+                                               filename=filename)
 
             # For views and dashboards currently the current filter
             # settings
             else:
                 uri = html.makeuri_contextless(vars_values + [(visual_type.ident_attr, name)],
                                                filename=filename)
+            linktitle = visual.get("linktitle")
+            if not linktitle:
+                linktitle = visual["title"]
             icon = visual.get("icon")
             buttonid = "cb_" + name
             context_links.append((_u(linktitle), uri, icon, buttonid))
@@ -2110,6 +2220,31 @@ def _collect_context_links_of(visual_type_name, view, rows, singlecontext_reques
     return context_links
 
 
+def _link_target_candidates(available_visuals, visual_type, view, mobile):
+    """Apply the checks which only need the visual definitions themselves, before the remaining
+    visuals are sorted and their contexts are checked"""
+    view_name = view.spec.get("name")
+    for visual in available_visuals.values():
+        if visual.get("hidebutton", False):
+            continue  # this visual does not want a button to be displayed
+
+        if not mobile and visual.get('mobile') \
+           or mobile and not visual.get('mobile'):
+            continue
+
+        # For dashboards and views we currently only show a link button,
+        # if the target dashboard/view shares a single info with the
+        # current visual.
+        if not visual['single_infos'] and not visual_type.multicontext_links:
+            continue  # skip non single visuals for dashboard, views
+
+        # Only compare the whole definitions in case the names match
+        if visual["name"] == view_name and visual == view.spec:
+            continue
+
+        yield visual
+
+
 @cmk.gui.pages.register("count_context_button")
 def ajax_count_button():
     id_ = html.request.get_str_input_mandatory("id")
@@ -2127,6 +2262,14 @@ def _sort_data(view, data, sorters):
     if not sorters:
         return
 
+    if all(entry.sorter.sort_key is not None for entry in sorters):
+        # The sort is stable, so sorting by the least significant sorter first results in the
+        # same order as the compare function below, but without calling Python code for each
+        # comparison.
+        for entry in reversed(sorters):
+            data.sort(key=_sort_key_of_entry(entry), reverse=entry.negate)
+        return
+
     # Handle case where join columns are not present for all rows
     def safe_compare(compfunc, row1, row2):
         # type: (Callable[[Row, Row], int], Row, Row) -> int
@@ -2156,31 +2299,68 @@ def _sort_data(view, data, sorters):
     data.sort(key=functools.cmp_to_key(multisort))
 
 
+def _sort_key_of_entry(entry):
+    # type: (SorterEntry) -> Callable[[Row], Any]
+    sort_key = entry.sorter.sort_key
+    assert sort_key is not None
+    join_key = entry.join_key
+    if not join_key:
+        return sort_key
+
+    # Rows without the joined row are sorted first, like safe_compare() in _sort_data() does
+    def join_sort_key(row):
+        # type: (Row) -> Any
+        join_row = row["JOIN"].get(join_key)
+        if join_row is None:
+            return (0,)
+        return (1, sort_key(join_row))
+
+    return join_sort_key
+
+
 def sorters_of_datasource(ds_name):
-    return _allowed_for_datasource(sorter_registry, ds_name)
+    # type: (Text) -> Dict[str, Sorter]
+    return _cached_for_datasource("sorters", ds_name,
+                                  lambda: _allowed_for_datasource(sorter_registry, ds_name))
 
 
 def painters_of_datasource(ds_name):
     # type: (Text) -> Dict[str, Painter]
-    return _allowed_for_datasource(painter_registry, ds_name)
+    return _cached_for_datasource("painters", ds_name,
+                                  lambda: _allowed_for_datasource(painter_registry, ds_name))
 
 
 def join_painters_of_datasource(ds_name):
+    # type: (Text) -> Dict[str, Painter]
+    return _cached_for_datasource("join_painters", ds_name,
+                                  lambda: _join_painters_of_datasource(ds_name))
+
+
+def _cached_for_datasource(what, ds_name, compute):
+    # type: (str, Text, Callable[[], Dict[str, Any]]) -> Dict[str, Any]
+    """The view editor asks for the plugins of a datasource several times while rendering a
+    single page. Compute them only once per request. Don't modify the result."""
+    cache = g.setdefault("plugins_of_datasource", {})
+    cache_key = (what, ds_name)
+    if cache_key not in cache:
+        cache[cache_key] = compute()
+    return cache[cache_key]
+
+
+def _join_painters_of_datasource(ds_name):
+    # type: (Text) -> Dict[str, Painter]
     datasource = data_source_registry[ds_name]()
     if datasource.join is None:
         return {}  # no joining with this datasource
 
     # Get the painters allowed for the join "source" and "target"
     painters = painters_of_datasource(ds_name)
-    join_painters_unfiltered = _allowed_for_datasource(painter_registry, datasource.join[0])
+    join_painters_unfiltered = painters_of_datasource(datasource.join[0])
 
     # Filter out painters associated with the "join source" datasource
-    join_painters = {}
-    for key, val in join_painters_unfiltered.items():
-        if key not in painters:
-            join_painters[key] = val
-
-    return join_painters
+    return {
+        key: val for key, val in join_painters_unfiltered.items() if key not in painters
+    }
 
 
 # Filters a list of sorters or painters and decides which of
@@ -2213,7 +2393,8 @@ def painter_choices(painters):
 
 def painter_choices_with_params(painters):
     # type: (Dict[str, Painter]) -> List[CascadingDropdownChoice]
-    return sorted(((name, get_painter_title_for_choices(painter),
+    dummy_view = View("", {}, {})
+    return sorted(((name, get_painter_title_for_choices(painter, dummy_view),
                     painter.parameters if painter.parameters else None)
                    for name, painter in painters.items()),
                   key=lambda x: x[1])
@@ -2233,8 +2414,8 @@ def get_sorter_title_for_choices(sorter):
     return u"%s: %s" % (info_title, sorter.title)
 
 
-def get_painter_title_for_choices(painter):
-    # type: (Painter) -> Text
+def get_painter_title_for_choices(painter, dummy_view=None):
+    # type: (Painter, Optional[View]) -> Text
     info_title = "/".join([
         visual_info_registry[info_name]().title_plural
         for info_name in sorted(infos_needed_by_painter(painter))
@@ -2244,7 +2425,11 @@ def get_painter_title_for_choices(painter):
     if painter.columns == ["site"]:
         info_title = _("Site")
 
-    dummy_cell = Cell(View("", {}, {}), PainterSpec(painter.ident))
+    # The title of some painters depends on the parameters of the cell. Callers asking for the
+    # titles of many painters can share the empty view the cells are created for.
+    if dummy_view is None:
+        dummy_view = View("", {}, {})
+    dummy_cell = Cell(dummy_view, PainterSpec(painter.ident))
     return u"%s: %s" % (info_title, painter.title(dummy_cell))
 
 
@@ -2279,13 +2464,24 @@ def should_show_command_form(datasource, ignore_display_option=False):
     # than one table, (like services datasource also provide host
     # information) then the first info is the primary table. So 'what'
     # will be one of "host", "service", "command" or "downtime".
-    what = datasource.infos[0]
-    for command_class in command_registry.values():
-        command = command_class()
-        if what in command.tables and config.user.may(command.permission().name):
-            return True
-
-    return False
+    return _may_use_commands_on(datasource.infos[0])
+
+
+def _may_use_commands_on(what):
+    # type: (str) -> bool
+    """Whether or not the user may use at least one command on the given table
+
+    This is asked several times while rendering a view, so the answer is computed only once
+    per request."""
+    cache = g.setdefault("may_use_commands_on", {})
+    if what not in cache:
+        cache[what] = False
+        for command_class in command_registry.values():
+            command = command_class()
+            if what in command.tables and config.user.may(command.permission().name):
+                cache[what] = True
+                break
+    return cache[what]
 
 
 def show_command_form(is_open, datasource):
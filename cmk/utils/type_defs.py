@@ -6,6 +6,7 @@
 """Checkmk wide type definitions"""
 
 import abc
+import re
 import string
 from typing import Union, NamedTuple, NewType, Any, Text, Optional, Dict, Set, List, Tuple
 
@@ -137,6 +138,9 @@ class SNMPHostConfig(
             ("is_inline_snmp_host", bool),
             ("record_stats", bool),
         ])):
+    # Don't add an instance dict to the tuple, all values are stored in the tuple fields
+    __slots__ = ()
+
     @property
     def is_snmpv3_host(self):
         # type: () -> bool
@@ -145,25 +149,32 @@ class SNMPHostConfig(
     def update(self, **kwargs):
         # type: (Dict[str, Any]) -> SNMPHostConfig
         """Return a new SNMPHostConfig with updated attributes."""
-        cfg = self._asdict()
-        cfg.update(**kwargs)
-        return SNMPHostConfig(**cfg)
+        return self._replace(**kwargs)
 
 
 class OIDSpec(object):  # pylint: disable=bad-option-value, useless-object-inheritance
     """Basic class for OID spec of the form ".1.2.3.4.5" or "2.3"
     """
-    VALID_CHARACTERS = '.' + string.digits
+    __slots__ = ("_value",)
+
+    VALID_CHARACTERS = frozenset('.' + string.digits)
+    # Non-empty, only valid characters and not ending with '.'
+    _VALID_PATTERN = re.compile(r"[.0-9]*[0-9]\Z")
+    _VALID_CHARACTERS_PATTERN = re.compile(r"[.0-9]+")
 
     @classmethod
     def validate(cls, value):
         # type: (str) -> None
         if not isinstance(value, str):
             raise TypeError("expected a non-empty string: %r" % (value,))
+        if cls._VALID_PATTERN.match(value):
+            return
+
+        # Find out what is wrong with the value
         if not value:
             raise ValueError("expected a non-empty string: %r" % (value,))
 
-        invalid = ''.join(c for c in value if c not in cls.VALID_CHARACTERS)
+        invalid = cls._VALID_CHARACTERS_PATTERN.sub("", value)
         if invalid:
             raise ValueError("invalid characters in OID descriptor: %r" % invalid)
 
@@ -187,13 +198,15 @@ class OIDSpec(object):  # pylint: disable=bad-option-value, useless-object-inher
             raise TypeError("cannot add %r" % (right,))
         if not self._value.startswith('.') or right._value.startswith('.'):
             raise ValueError("can only add full OIDs to partial OIDs")
-        return right.__class__("%s.%s" % (self, right))
+        return right.__class__(self._value + "." + right._value)
 
     def __eq__(self, other):
         # type: (Any) -> bool
-        if other.__class__ != self.__class__:
-            return False
-        return self._value == other._value
+        return type(other) is type(self) and self._value == other._value
+
+    def __hash__(self):
+        # type: () -> int
+        return hash(self._value)
 
     def __str__(self):
         # type: () -> str
@@ -20,6 +20,11 @@ def scan_kea(oid):
     return oid(".O.I.D") == "Kea"
 
 
+def scan_parrot(oid):
+    """Scan function scanning for any bird"""
+    return bool(oid(".O.I.D"))
+
+
 def test_mutex_scan_registry_register():
     scan_registry = snmp_utils.MutexScanRegistry()
 
@@ -30,12 +35,9 @@ def test_mutex_scan_registry_register():
 
 def test_mutex_scan_registry_as_fallback():
     scan_registry = snmp_utils.MutexScanRegistry()
+    scan_parrot_fallback = scan_registry.as_fallback(scan_parrot)
 
-    @scan_registry.as_fallback
-    def scan_parrot(oid):
-        return bool(oid(".O.I.D"))
-
-    assert scan_parrot(oid_kea)
+    assert scan_parrot_fallback(oid_kea)
 
     scan_registry.register(scan_kea)
-    assert not scan_parrot(oid_kea)
+    assert not scan_parrot_fallback(oid_kea)
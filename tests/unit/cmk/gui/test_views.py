@@ -7,7 +7,7 @@
 # yapf: disable
 
 import copy
-from typing import Any, Dict  # pylint: disable=unused-import
+from typing import Any, Dict, List  # pylint: disable=unused-import
 
 import pytest  # type: ignore[import]
 import six
@@ -18,9 +18,10 @@ import cmk.utils.version as cmk_version
 pytestmark = pytest.mark.usefixtures("load_plugins")
 
 from cmk.gui.globals import html
+from cmk.gui.exceptions import MKUserError
 from cmk.gui.valuespec import ValueSpec
 import cmk.gui.plugins.views
-from cmk.gui.plugins.views.utils import transform_painter_spec
+from cmk.gui.plugins.views.utils import transform_painter_spec, SorterEntry
 from cmk.gui.type_defs import PainterSpec
 import cmk.gui.views
 
@@ -5809,6 +5810,22 @@ def test_create_view_basics():
     assert view.only_sites is None
 
 
+def test_view_cells_are_cached(view):
+    assert view.row_cells is view.row_cells
+    assert view.group_cells is view.group_cells
+    assert view.join_cells is view.join_cells
+
+
+def test_view_datasource_is_cached(view):
+    assert view.datasource is view.datasource
+
+
+def test_view_unknown_datasource():
+    view = cmk.gui.views.View("abc", {"datasource": "not_existing"}, {})
+    with pytest.raises(MKUserError, match="not_existing"):
+        _ = view.datasource
+
+
 def test_view_row_limit(view):
     assert view.row_limit is None
     view.row_limit = 101
@@ -5852,6 +5869,144 @@ def test_view_user_sorters(view):
     assert view.user_sorters == [("abc", True)]
 
 
+def test_view_sorters_are_cached(view):
+    sorters = view.sorters
+    assert view.sorters is sorters
+
+    view.user_sorters = [("sitealias", True)]
+    assert view.sorters is not sorters
+    assert [(e.sorter.ident, e.negate) for e in view.sorters] == [("sitealias", True)]
+
+
+@pytest.mark.parametrize("negate", [False, True])
+def test_sort_data_by_sort_keys(monkeypatch, view, negate):
+    utils = cmk.gui.plugins.views.utils
+    monkeypatch.setattr(utils, "sorter_registry", utils.SorterRegistry())
+    for column, cmp_func in [("s", utils.cmp_simple_string), ("n", utils.cmp_simple_number)]:
+        utils.declare_simple_sorter(column, u"Key", column, cmp_func)
+        utils.register_sorter(column + "_cmp", {
+            "title": u"Cmp",
+            "columns": [column],
+            "cmp": lambda self, r1, r2, column=column, cmp_func=cmp_func: cmp_func(column, r1, r2),
+        })
+
+    sorters = {ident: utils.sorter_registry[ident]() for ident in ["s", "n", "s_cmp", "n_cmp"]}
+    assert sorters["s"].sort_key is not None
+    assert sorters["s_cmp"].sort_key is None
+
+    rows = [
+        {"s": "b", "n": 2, "JOIN": {}},
+        {"s": "B", "n": 1, "JOIN": {"x": {"s": "a", "n": 1}}},
+        {"s": "a", "n": 2, "JOIN": {"x": {"s": "A", "n": 1}}},
+        {"s": "b", "n": 1, "JOIN": {"x": {"s": "a", "n": 3}}},
+    ]
+
+    def sorted_rows(entries, suffix):
+        data = list(rows)
+        cmk.gui.views._sort_data(view, data, [
+            SorterEntry(sorters[ident + suffix], entry_negate, join_key)
+            for ident, entry_negate, join_key in entries
+        ])
+        return data
+
+    for entries in [
+        [("s", negate, None), ("n", not negate, None)],
+        [("n", negate, "x"), ("s", negate, None)],
+    ]:
+        assert sorted_rows(entries, "") == sorted_rows(entries, "_cmp")
+
+
+def test_cell_painter_and_columns_are_cached(view):
+    cell = view.row_cells[0]
+    assert cell.painter() is cell.painter()
+    assert cell.needed_columns() is cell.needed_columns()
+    assert set(cell.painter().columns) <= cell.needed_columns()
+
+
+def test_do_table_join(monkeypatch, view):
+    assert view.datasource.join == ("services", "host_name")
+    slave_rows = [
+        {"site": "s", "host_name": "A", "service_description": "x"},
+        {"site": "s", "host_name": "B", "service_description": "y"},
+        {"site": "s", "host_name": "A", "service_description": "z"},
+        {"site": "s", "host_name": "D", "service_description": "x"},
+        {"site": "t", "host_name": "B", "service_description": "y"},
+    ]
+    monkeypatch.setattr(cmk.gui.plugins.views.utils.RowTableLivestatus, "query",
+                        lambda self, *args, **kwargs: slave_rows)
+
+    master_rows = [
+        {"site": "s", "host_name": "A"},
+        {"site": "s", "host_name": "B"},
+        {"site": "s", "host_name": "C"},
+    ]  # type: List[Dict[str, Any]]
+    cmk.gui.views._do_table_join(view, master_rows, "", [])
+
+    assert master_rows[0]["JOIN"] == {"x": slave_rows[0], "z": slave_rows[2]}
+    assert master_rows[1]["JOIN"] == {"y": slave_rows[1]}
+    assert master_rows[2]["JOIN"] == {}
+
+
+@pytest.mark.parametrize("multicontext_links, expected", [
+    (False, [
+        (u"Host A", "view.py?host=h&view_name=host_a", "b", "cb_host_a"),
+    ]),
+    (True, [
+        (u"All hosts", "view.py?foo=bar&host=h&view_name=hosts_all", "a", "cb_hosts_all"),
+        (u"Host A", "view.py?foo=bar&host=h&view_name=host_a", "b", "cb_host_a"),
+    ]),
+])
+def test_collect_context_links_of(monkeypatch, view, multicontext_links, expected):
+    def visual(name, single_infos, **kwargs):
+        spec = {
+            "name": name,
+            "title": name,
+            "single_infos": single_infos,
+            "link_from": {},
+        }
+        spec.update(kwargs)
+        return spec
+
+    permitted_visuals = {
+        "host_a": visual("host_a", ["host"], title=u"Host A", icon="b"),
+        "hosts_all": visual("hosts_all", [], linktitle=u"All hosts", icon="a"),
+        "host_hidden": visual("host_hidden", ["host"], hidebutton=True),
+        "host_mobile": visual("host_mobile", ["host"], mobile=True),
+        "service": visual("service", ["service"]),
+        view.name: view.spec,
+    }
+    monkeypatch.setattr(cmk.gui.views.VisualTypeViews, "permitted_visuals",
+                        property(lambda self: permitted_visuals))
+    monkeypatch.setattr(cmk.gui.views.VisualTypeViews, "multicontext_links",
+                        property(lambda self: multicontext_links))
+
+    html.request.set_var("host", "h")
+    html.request.set_var("foo", "bar")
+    html.request.set_var("view_name", view.name)
+    html.request.set_var("_transid", "123")
+
+    links = cmk.gui.views._collect_context_links_of("views", view, [], {"host": "h"}, False)
+    assert links == expected
+
+    if multicontext_links:
+        # The links carry the current request variables, like html.makeuri() adds them
+        for _title, uri, _icon, buttonid in links:
+            assert uri == html.makeuri([("view_name", buttonid[3:])], filename="view.py")
+
+
+def test_canonical_tags():
+    canonical = cmk.gui.views._canonical_tags({
+        "tag_groups": [{"id": "grp", "title": u"Group", "tags": [{"id": None, "aux_tags": []}]}],
+        "aux_tags": [],
+    })
+    assert canonical == (
+        ("aux_tags", ()),
+        ("tag_groups", ((("id", "grp"), ("tags", ((("aux_tags", ()), ("id", None)),)),
+                         ("title", u"Group")),)),
+    )
+    assert isinstance(hash(canonical), int)
+
+
 def test_registered_display_hints():
     expected = ['.',
     '.hardware.',
@@ -52,3 +52,9 @@ def test_oidspec():
     oid_sum = oid_base + oid_column
     assert isinstance(oid_sum, OIDBytes)
     assert str(oid_sum) == ".1.2.3.4.5"
+
+
+def test_oidspec_hash():
+    assert OIDSpec(".1.2.3") == OIDSpec(".1.2.3")
+    assert OIDSpec(".1.2.3") != OIDBytes(".1.2.3")
+    assert len({OIDSpec(".1.2.3"), OIDSpec(".1.2.3"), OIDBytes(".1.2.3")}) == 2